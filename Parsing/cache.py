@@ -0,0 +1,102 @@
+"""
+Local SQLite cache of downloaded feeds, keyed by URL.
+
+Stores the ETag / Last-Modified validators the server sent together with the
+raw ICS body, so an unchanged feed (HTTP 304) skips the body download. The
+body is re-parsed on every run, so parser changes and source names are never
+served stale from the cache.
+
+
+Any cache failure (unwritable dir, corrupt file, ...) is reported and treated
+as a cache miss, so the import falls back to an unconditional fetch.
+"""
+
+import os
+import sqlite3
+from typing import Dict, NamedTuple, Optional
+
+from .config import CACHE_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ics_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL
+)
+"""
+
+
+class CachedFeed(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def load_feed(url: str, path: Optional[str] = CACHE_PATH) -> Optional[CachedFeed]:
+    """Return the cached feed for `url`, or None if caching is off / no entry."""
+    if not path:
+        return None
+
+    try:
+        conn = _connect(path)
+        try:
+            row = conn.execute(
+                "SELECT etag, last_modified, body FROM ics_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Feed cache unavailable ({e}), fetching without it")
+        return None
+
+    if row is None:
+        return None
+    etag, last_modified, body = row
+    return CachedFeed(etag, last_modified, bytes(body))
+
+
+def store_feed(
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    body: bytes,
+    path: Optional[str] = CACHE_PATH,
+) -> None:
+    """Save the raw ICS body for `url` along with the response validators."""
+    if not path or not (etag or last_modified):
+        # Nothing to revalidate against next time.
+        return
+
+    try:
+        conn = _connect(path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ics_cache "
+                    "(url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                    (url, etag, last_modified, body),
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Could not update feed cache ({e})")
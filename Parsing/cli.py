@@ -10,27 +10,44 @@ Author: Bruno Rodrigues (BRodrigues98)
 
 
 import json
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
 
 from .client import run_import
 from .models import Event, to_serializable
 
+# Built once; json.dumps with custom options creates a new encoder per call.
+_JSON_ENCODER = json.JSONEncoder(
+    indent=4,
+    ensure_ascii=False,
+    sort_keys=True,
+    default=to_serializable,
+)
+
 
 def print_event(event: Event) -> None:
     """Pretty-print one event as JSON."""
-    print(
-        json.dumps(
-            event.to_dict(),
-            indent=4,
-            ensure_ascii=False,
-            sort_keys=True,
-            default=to_serializable,
+    if orjson is not None:
+        # orjson encodes datetimes natively (ISO 8601) and only indents by 2
+        print(
+            orjson.dumps(
+                event.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+                default=to_serializable,
+            ).decode()
         )
-    )
+        return
+
+    print(_JSON_ENCODER.encode(event.to_dict()))
 
 def main():
     events = run_import()
-    match_events = [e for e in events if e.event_type == "match"]
-    for e in match_events[:50]:
+    match_events = (e for e in events if e.event_type == "match")
+    for e in islice(match_events, 50):
         print_event(e)
 
 if __name__ == "__main__":
@@ -1,36 +1,100 @@
 import requests
-from datetime import datetime
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from icalendar import Calendar
 
+from .cache import load_feed, store_feed
 from .config import ECAL_URLS
+from .ics import UnsupportedICS, parse_ics_fast
 from .models import Event
 from .parsing import parse_event
 
-def fetch_and_parse(url: str, source_name: str) -> List[Event]:
-    print(f"Fetching: {url}")
-    resp = requests.get(url, timeout=15)
-    resp.raise_for_status()
+def download_ics(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 65536,
+    session: Optional[requests.Session] = None,
+) -> Tuple[Optional[bytes], Mapping[str, str]]:
+    """
+    Stream the raw ICS body, releasing the connection once it is read.
+
+    Returns (body, response headers); body is None on 304 Not Modified.
+    Pass a `session` to reuse keep-alive connections across feeds.
+    """
+    http = session or requests
+    with http.get(url, headers=headers, timeout=15, stream=True) as resp:
+        if resp.status_code == 304:
+            return None, resp.headers
+        resp.raise_for_status()
+        return b"".join(resp.iter_content(chunk_size=chunk_size)), resp.headers
+
+
+def read_vevents(body: bytes) -> List[Any]:
+    """
+    VEVENT components of an ICS body, for parse_event.
 
-    cal = Calendar.from_ical(resp.content)
-    events: List[Event] = []
+    Uses the fast reader in .ics and falls back to icalendar for feeds it
+    does not support.
+    """
+    try:
+        return parse_ics_fast(body)
+    except UnsupportedICS as e:
+        print(f"Fast ICS reader gave up ({e}), falling back to icalendar")
+
+    cal = Calendar.from_ical(body)
+    return cal.walk("VEVENT")
+
+
+def fetch_and_parse(
+    url: str,
+    source_name: str,
+    session: Optional[requests.Session] = None,
+) -> List[Event]:
+    print(f"Fetching: {url}")
+    cached = load_feed(url)
+    body, headers = download_ics(
+        url, cached.conditional_headers() if cached else None, session=session
+    )
 
-    for component in cal.walk():
-        if component.name != "VEVENT":
-            continue
-        events.append(parse_event(component, source_name=source_name))
+    not_modified = body is None
+    if not_modified:
+        if cached is None:
+            return []
+        print(f"Not modified, using cache: {url}")
+        body = cached.body
 
-    return events
+    components = read_vevents(body)
+    if not not_modified:
+        # only cache bodies that parsed, so a broken one is not replayed on 304
+        store_feed(url, headers.get("ETag"), headers.get("Last-Modified"), body)
+    # Drop the raw bytes once parsed, so they are freed before the events
+    # are built.
+    del body, cached
+    return [
+        parse_event(component, source_name=source_name) for component in components
+    ]
 
 
 def run_import() -> List[Event]:
     all_events: List[Event] = []
 
-    for idx, url in enumerate(ECAL_URLS):
-        source_name = f"feed_{idx}"
-        events = fetch_and_parse(url, source_name)
-        all_events.extend(events)
+    # Feeds are fetched concurrently over one shared session (keep-alive);
+    # results are collected in feed order.
+    with requests.Session() as session, ThreadPoolExecutor(
+        max_workers=min(8, len(ECAL_URLS) or 1)
+    ) as pool:
+        futures = [
+            pool.submit(fetch_and_parse, url, f"feed_{idx}", session)
+            for idx, url in enumerate(ECAL_URLS)
+        ]
+        for future in futures:
+            all_events.extend(future.result())
 
-    # sort by start time
-    all_events.sort(key=lambda e: e.start or datetime.max)
+    # sort by start time (in place), events without one go last
+    undated = [e for e in all_events if e.start is None]
+    if undated:
+        all_events = [e for e in all_events if e.start is not None]
+    all_events.sort(key=attrgetter("start"))
+    all_events.extend(undated)
     return all_events
@@ -1,5 +1,7 @@
-import pytz
-TZ = pytz.timezone("Europe/Lisbon")
+import os
+from zoneinfo import ZoneInfo
+
+TZ = ZoneInfo("Europe/Lisbon")
 
 # Config the ICS URL(s)
 # TODO: Put this in a .env or config
@@ -7,6 +9,14 @@ ECAL_URLS = [
     "https://ics.ecal.com/ecal-sub/6915f30f396fa00008c2a014/SL%20Benfica.ics"
 ]
 
+# Local cache of downloaded feeds (ETag / Last-Modified), kept in the user's
+# cache dir rather than wherever the script runs. Set to None to disable.
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "benfica-calendar",
+    "ecal_cache.sqlite3",
+)
+
 BENFICA_NAME = "SL Benfica"
 
 # keywords for segmentation
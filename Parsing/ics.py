@@ -0,0 +1,155 @@
+"""
+Minimal VEVENT reader for eCal ICS feeds.
+
+icalendar's Calendar.from_ical builds a full component tree and decodes every
+property, which dominates import time. eCal feeds are simple, so this reader
+only unfolds the content lines, walks the VEVENT blocks and decodes the few
+properties parse_event reads. Anything it cannot decode faithfully raises
+UnsupportedICS, so callers can fall back to icalendar.
+"""
+
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+class UnsupportedICS(ValueError):
+    """The feed uses something this reader does not handle."""
+
+
+class DateProp(NamedTuple):
+    """Stand-in for icalendar's vDDDTypes: the decoded value lives in `.dt`."""
+
+    dt: Union[date, datetime]
+
+
+# Properties parse_event reads, split by how their value is decoded
+_TEXT_PROPS = frozenset({"UID", "SUMMARY", "DESCRIPTION", "LOCATION"})
+_DATE_PROPS = frozenset({"DTSTART", "DTEND"})
+
+_RE_TEXT_ESCAPE = re.compile(r"\\([\\;,nN])")
+_TEXT_UNESCAPES = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
+
+def _unescape_text(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _RE_TEXT_ESCAPE.sub(lambda m: _TEXT_UNESCAPES[m.group(1)], value)
+
+
+def _split_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Split a content line into (NAME, {PARAM: value}, value)."""
+    colon = line.find(":")
+    quote = line.find('"')
+    if 0 <= quote < colon:
+        # A quoted parameter value may itself contain ':' (e.g. ALTREP="http://...")
+        in_quotes = False
+        for i, ch in enumerate(line):
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ":" and not in_quotes:
+                colon = i
+                break
+    if colon < 0:
+        raise UnsupportedICS(f"Malformed content line: {line!r}")
+
+    head, value = line[:colon], line[colon + 1 :]
+    name, _, raw_params = head.partition(";")
+    params: Dict[str, str] = {}
+    if raw_params:
+        for param in raw_params.split(";"):
+            key, _, val = param.partition("=")
+            params[key.upper()] = val.strip('"')
+    return name.upper(), params, value
+
+
+def _parse_date(value: str, params: Dict[str, str]) -> DateProp:
+    try:
+        if params.get("VALUE") == "DATE" or len(value) == 8:
+            return DateProp(datetime.strptime(value, "%Y%m%d").date())
+
+        if value.endswith("Z"):
+            dt = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S")
+            return DateProp(dt.replace(tzinfo=timezone.utc))
+
+        dt = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    except ValueError as e:
+        raise UnsupportedICS(f"Unsupported date value: {value!r}") from e
+
+    tzid = params.get("TZID")
+    if tzid is None:
+        # floating local time
+        return DateProp(dt)
+    try:
+        return DateProp(dt.replace(tzinfo=ZoneInfo(tzid)))
+    except (ZoneInfoNotFoundError, ValueError, OSError) as e:
+        # custom VTIMEZONE definitions need icalendar; OSError covers TZIDs
+        # naming a tzdata directory ("Brazil", "US") or too long for a filename
+        raise UnsupportedICS(f"Unknown TZID: {tzid!r}") from e
+
+
+def _unfold(raw: bytes) -> List[str]:
+    """
+    Undo RFC 5545 line folding (a line break followed by one space/tab).
+
+    Folding happens on octets and may split a multi-byte UTF-8 character,
+    so the body is unfolded as bytes and only then decoded.
+    """
+    raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    raw = raw.replace(b"\n ", b"").replace(b"\n\t", b"")
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise UnsupportedICS(f"Body is not valid UTF-8: {e}") from e
+    return text.split("\n")
+
+
+def parse_ics_fast(raw: bytes) -> List[Dict[str, Any]]:
+    """
+    Read every VEVENT in `raw` into a dict keyed by lowercase property name.
+
+    Text properties are plain strings and DTSTART/DTEND are DateProp, so the
+    dicts can be passed to parse_event like icalendar components.
+    """
+    events: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    nested = 0  # depth of sub-components (e.g. VALARM) inside the VEVENT
+
+    for line in _unfold(raw):
+        if not line:
+            continue
+
+        if line.startswith("BEGIN:"):
+            if current is not None:
+                nested += 1
+            elif line[6:].upper() == "VEVENT":
+                current = {}
+            continue
+
+        if line.startswith("END:"):
+            if current is None:
+                continue
+            if nested:
+                nested -= 1
+            elif line[4:].upper() == "VEVENT":
+                events.append(current)
+                current = None
+            continue
+
+        if current is None or nested:
+            continue
+
+        name, params, value = _split_line(line)
+        key = name.lower()
+        if key in current:
+            continue
+        if name in _TEXT_PROPS:
+            current[key] = _unescape_text(value)
+        elif name in _DATE_PROPS:
+            current[key] = _parse_date(value, params)
+
+    if current is not None:
+        raise UnsupportedICS("Unterminated VEVENT")
+
+    return events
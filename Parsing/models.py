@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Structured representation of one ECAL VEVENT."""
 
@@ -50,6 +50,19 @@ class Event:
         }
 
 
+class SummaryInfo(NamedTuple):
+    """What parse_summary extracts from one SUMMARY line (immutable, cacheable)."""
+
+    event_type: str  # "match" or "other"
+    team_a: Optional[str]
+    team_b: Optional[str]
+    benfica_home: Optional[bool]
+    opponent: Optional[str]
+    sport: Optional[str]
+    squad_label: Optional[str]
+    broadcast: Optional[str]
+
+
 def to_serializable(obj: Any):
     """Default JSON serializer for objects we care about."""
     if isinstance(obj, datetime):
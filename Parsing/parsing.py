@@ -1,6 +1,8 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Optional
 import re
+import sys
 from icalendar import Event as ICalEvent
 
 from .config import (
@@ -11,7 +13,63 @@ from .config import (
     FOOTBALL_COMP_KEYWORDS,
     BROADCAST_KEYWORDS,
 )
-from .models import Event
+from .models import Event, SummaryInfo
+
+# -------------------------------------------------------------------
+# Precompiled patterns
+# -------------------------------------------------------------------
+
+# Digit-only patterns are ASCII; \W / \s must stay Unicode-aware so accented
+# team names and non-breaking spaces are handled.
+_RE_JORNADA = re.compile(r"Jornada\s+(\d+)", re.ASCII)
+_RE_LEADING_NONWORD = re.compile(r"^\W+")
+_RE_WS = re.compile(r"\s+")
+_RE_SEASON = re.compile(r"^(?:\d{2}/\d{2}|\d{4}/\d{2})$", re.ASCII)
+_RE_COMP_LINE = re.compile(
+    r"(?P<comp>.+?)\s+(?P<season>\d{2}/\d{2}|\d{4}/\d{2})"
+    r"(?:\s*-\s*Jornada\s+(?P<j>\d+))?$"
+)
+# first line that starts with "http" (surrounding whitespace stripped)
+_RE_TICKET_URL = re.compile(r"^\s*(http.*?)\s*$", re.MULTILINE)
+_RE_BILHETE = re.compile(r"bilhete", re.IGNORECASE)
+_RE_BILHETES = re.compile(r"bilhetes", re.IGNORECASE)
+_RE_TICKET_SUMMARY = re.compile(r"🎫 bilhetes|bilhetes ", re.IGNORECASE)
+_RE_SALES_CRITERIA = re.compile(r"critérios de venda", re.IGNORECASE)
+_RE_FEMININE = re.compile(r"feminin[ao]", re.IGNORECASE)
+# "Sub-23", "Sub 23", "Sub-19", "Sub 19", "Juniores", "Equipa B"
+_RE_FOOTBALL_YOUTH = re.compile(r"Sub[- ](?:23|19)|Juniores|Equipa B")
+
+
+def _keyword_alternation(keywords, flags: int = 0) -> "re.Pattern[str]":
+    """
+    Compile a keyword list into one alternation.
+
+    Longer keywords are tried first, so at any position the longest keyword
+    wins (e.g. "Hóquei em Patins" over "Hóquei"). The alternation finds the
+    occurrences; callers that care about list priority rank them afterwards.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered), flags)
+
+
+_SPORT_RE = _keyword_alternation(SPORT_KEYWORDS)
+# SPORT_KEYWORDS order decides which sport wins when several appear
+_SPORT_PRIORITY = {k: i for i, k in enumerate(SPORT_KEYWORDS)}
+_FOOTBALL_SQUAD_RE = _keyword_alternation(FOOTBALL_SQUAD_KEYWORDS)
+# competition names come in any case; the keywords are lowercase
+_FOOTBALL_COMP_RE = _keyword_alternation(FOOTBALL_COMP_KEYWORDS, re.IGNORECASE)
+_BROADCAST_RE = _keyword_alternation(BROADCAST_KEYWORDS)
+
+_OTHER_SUMMARY = SummaryInfo(
+    event_type="other",
+    team_a=None,
+    team_b=None,
+    benfica_home=None,
+    opponent=None,
+    sport=None,
+    squad_label=None,
+    broadcast=None,
+)
 
 # -------------------------------------------------------------------
 # Helper functions (pure-ish logic)
@@ -33,32 +91,62 @@ def is_ticketing_event(
     - Fallback: SUMMARY contains 'bilhetes' and has no ' | ' separators,
       which normal match summaries use.
     """
-    s = (summary or "").strip().lower()
-    d = (description or "").strip().lower()
-    c = (competition or "").strip().lower()
+    summary = summary or ""
+    description = description or ""
+    competition = competition or ""
+
+    # Cheap literal probe on the original strings: every heuristic below
+    # needs either "bilhetes" in the summary or "critérios" in the
+    # description/competition. Dropping the first letter covers both
+    # "Bilhetes" and "bilhetes"; the upper-case probe covers ALL-CAPS text.
+    # Most events fail this, so they skip the case-insensitive scans below.
+    if not (
+        "ilhetes" in summary
+        or "ILHETES" in summary
+        or "ritérios" in description
+        or "RITÉRIOS" in description
+        or "ritérios" in competition
+        or "RITÉRIOS" in competition
+    ):
+        return False
 
     # Very strong signal
-    if "critérios de venda" in d or c.startswith("critérios de venda"):
+    if _RE_SALES_CRITERIA.search(description) or _RE_SALES_CRITERIA.match(
+        competition.lstrip()
+    ):
         return True
 
     # Typical ECAL pattern: "🎫 Bilhetes ⚽ SL Benfica x ..."
-    if s.startswith("🎫 bilhetes") or s.startswith("bilhetes "):
+    if _RE_TICKET_SUMMARY.match(summary.lstrip()):
         return True
 
     # Fallback: summary talks about tickets but doesn't look like our
     # normal "Team x Team | Sport ..." template (no ' | ').
-    if "bilhetes" in s and " | " not in s:
+    if _RE_BILHETES.search(summary) and " | " not in summary.strip():
         return True
 
     return False
 
 
+def _text(value) -> str:
+    """
+    Property value as a plain str ("" when missing).
+
+    Plain strings (from the fast ICS reader) are returned as-is; icalendar's
+    vText is a str subclass and gets converted once.
+    """
+    if value is None:
+        return ""
+    return value if type(value) is str else str(value)
+
+
 def is_benfica_team(name: str) -> bool:
     if not name:
         return False
     return name.startswith(BENFICA_NAME)
 
 
+@lru_cache(maxsize=8192)
 def parse_competition_line(
     first_line: str,
 ) -> tuple[Optional[str], Optional[str], Optional[int]]:
@@ -82,29 +170,25 @@ def parse_competition_line(
     matchday: Optional[int] = None
 
     if "|" in first_line:
-        comp_name, rest = [s.strip() for s in first_line.split("|", 1)]
-        competition = comp_name
+        comp_name, _, rest = first_line.partition("|")
+        competition = comp_name.strip()
         rest = rest.strip()
 
         if "-" in rest:
             # e.g. "25/26 - Jornada 4"
-            season_part, rest2 = [s.strip() for s in rest.split("-", 1)]
-            season = season_part
+            season_part, _, rest2 = rest.partition("-")
+            season = season_part.strip()
 
-            m = re.search(r"Jornada\s+(\d+)", rest2)
+            m = _RE_JORNADA.search(rest2)
             if m:
                 matchday = int(m.group(1))
         else:
             # just "25/26" → treat as season
-            if re.match(r"^\d{2}/\d{2}$", rest) or re.match(r"^\d{4}/\d{2}$", rest):
+            if _RE_SEASON.match(rest):
                 season = rest
     else:
         # Try "Segunda Liga 25/26 - Jornada 9" or "CEV Challenge Cup 25/26"
-        m = re.match(
-            r"(?P<comp>.+?)\s+(?P<season>\d{2}/\d{2}|\d{4}/\d{2})"
-            r"(?:\s*-\s*Jornada\s+(?P<j>\d+))?$",
-            first_line,
-        )
+        m = _RE_COMP_LINE.match(first_line)
         if m:
             competition = m.group("comp").strip()
             season = m.group("season").strip()
@@ -118,18 +202,48 @@ def parse_competition_line(
     return competition, season, matchday
 
 
+def guess_football(
+    summary: str,
+    competition: Optional[str],
+    squad_label: Optional[str],
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Fallback for matches whose SUMMARY names no sport.
+
+    Returns (sport, squad_label): sport is "Futebol" when the summary or the
+    competition hints at football (None otherwise), and a missing squad label
+    is guessed. Each check only runs if the previous ones were inconclusive.
+    """
+    # football emoji in summary (also matches the "⚽️" VS16 variant, which
+    # starts with it), or competition name hints it's football
+    if not (
+        "⚽" in summary
+        or (competition and _FOOTBALL_COMP_RE.search(competition))
+    ):
+        return None, squad_label
+
+    # if we still don't know the squad/gender, try to guess
+    if squad_label is not None:
+        return "Futebol", squad_label
+    if _RE_FEMININE.search(competition or "") or _RE_FEMININE.search(summary):
+        return "Futebol", "Feminino"
+    if _RE_FOOTBALL_YOUTH.search(summary):
+        # leave as-is; parse_summary usually sets it anyway
+        return "Futebol", None
+    # default to senior men's team
+    return "Futebol", "Masculino"
+
+
 def extract_ticket_url(description: str) -> Optional[str]:
     """Find the first HTTP(S) URL in the description (usually the ticket link)."""
-    for line in description.splitlines():
-        line = line.strip()
-        if line.startswith("http"):
-            return line
-    return None
+    m = _RE_TICKET_URL.search(description)
+    return m.group(1) if m else None
 
 
-def parse_summary(summary: str) -> Dict[str, Any]:
+@lru_cache(maxsize=8192)
+def parse_summary(summary: str) -> SummaryInfo:
     """
-    Break SUMMARY into:
+    Break SUMMARY into a (cached, immutable) SummaryInfo:
     - event_type: "match" or "other"
     - team_a, team_b
     - benfica_home, opponent
@@ -137,56 +251,56 @@ def parse_summary(summary: str) -> Dict[str, Any]:
     - broadcast (e.g. "📺 BTV")
     """
     summary = summary.strip()
-    if not summary:
-        return {
-            "event_type": "other",
-            "team_a": None,
-            "team_b": None,
-            "benfica_home": None,
-            "opponent": None,
-            "sport": None,
-            "squad_label": None,
-            "broadcast": None,
-        }
+    # Every match segment contains " x ", so summaries without one (museum,
+    # tickets, etc.) are "other" without splitting anything.
+    if " x " not in summary:
+        return _OTHER_SUMMARY
 
     # e.g. "⚽ SL Benfica x Paços Ferreira | Equipa B | 📺 BTV"
-    segments = [s.strip() for s in summary.split("|") if s.strip()]
+    # Single pass over the segments: find the one with the actual match
+    # (contains " x "), then classify every segment AFTER it as
+    # modality / broadcast info.
+    match_seg: Optional[str] = None
+    modality_segment: Optional[str] = None
+    broadcast_info: Optional[str] = None
 
-    # 1) Find the segment that has the actual match (contains " x ")
-    match_idx = None
-    for i, seg in enumerate(segments):
-        if " x " in seg:
-            match_idx = i
-            break
+    for seg in summary.split("|"):
+        seg = seg.strip()
+        if not seg:
+            continue
+
+        if match_seg is None:
+            if " x " in seg:
+                match_seg = seg
+            continue
+
+        # If it looks like TV/broadcast info, stash separately and skip for modality
+        if _BROADCAST_RE.search(seg):
+            broadcast_info = seg
+            continue
+
+        # First non-broadcast segment after the match we treat as "modality / squad"
+        if modality_segment is None:
+            modality_segment = seg
 
     # If there's no "x", we treat this as non-match (museum, tickets, etc.)
-    if match_idx is None:
-        return {
-            "event_type": "other",
-            "team_a": None,
-            "team_b": None,
-            "benfica_home": None,
-            "opponent": None,
-            "sport": None,
-            "squad_label": None,
-            "broadcast": None,
-        }
-
-    match_seg = segments[match_idx]
+    if match_seg is None:
+        return _OTHER_SUMMARY
 
     # Remove leading emojis / non-word chars
-    match_clean = re.sub(r"^\W+", "", match_seg).strip()
+    match_clean = _RE_LEADING_NONWORD.sub("", match_seg).strip()
 
     team_a = team_b = None
     benfica_home = None
     opponent = None
 
     if " x " in match_clean:
-        team_a, team_b = [s.strip() for s in match_clean.split(" x ", 1)]
+        team_a, _, team_b = match_clean.partition(" x ")
 
-        # normalize whitespace in team names
-        team_a = re.sub(r"\s+", " ", team_a)
-        team_b = re.sub(r"\s+", " ", team_b)
+        # normalize whitespace in team names (only after splitting, so a tab
+        # or NBSP next to an "x" cannot create an earlier split point)
+        team_a = _RE_WS.sub(" ", team_a.strip())
+        team_b = _RE_WS.sub(" ", team_b.strip())
 
         a_is_benfica = is_benfica_team(team_a)
         b_is_benfica = is_benfica_team(team_b)
@@ -201,56 +315,42 @@ def parse_summary(summary: str) -> Dict[str, Any]:
             benfica_home = None
             opponent = team_b or team_a
 
-    # 2) Look at segments AFTER the match for modality / broadcast info
-    metadata_segments = segments[match_idx + 1 :]
-
-    modality_segment: Optional[str] = None
-    broadcast_info: Optional[str] = None
-
-    for seg in metadata_segments:
-        # If it looks like TV/broadcast info, stash separately and skip for modality
-        if any(b in seg for b in BROADCAST_KEYWORDS):
-            broadcast_info = seg
-            continue
-
-        # First non-broadcast segment after the match we treat as "modality / squad"
-        if modality_segment is None:
-            modality_segment = seg
-
     sport: Optional[str] = None
     squad_label: Optional[str] = None
 
     # Heuristics: decide sport + squad_label
     if modality_segment:
         # If the segment contains a known sport keyword
-        for sk in SPORT_KEYWORDS:
-            if sk in modality_segment:
-                sport = sk
-                # Everything after the sport word becomes "squad label"
-                # e.g. "Andebol Feminino" -> squad_label="Feminino"
-                after = modality_segment.split(sk, 1)[1].strip()
-                squad_label = after if after else None
-                break
+        # (first keyword in SPORT_KEYWORDS order, not first in the text)
+        m = min(
+            _SPORT_RE.finditer(modality_segment),
+            key=lambda hit: _SPORT_PRIORITY[hit.group(0)],
+            default=None,
+        )
+        if m:
+            # interned: cached results and events share one copy per sport
+            sport = sys.intern(m.group(0))
+            # Everything after the sport word becomes "squad label"
+            # e.g. "Andebol Feminino" -> squad_label="Feminino"
+            after = modality_segment[m.end() :].strip()
+            squad_label = sys.intern(after) if after else None
 
         # If we still don't know sport but we see football squad words,
         # assume it's football and use the whole segment as squad label.
-        if sport is None:
-            for fk in FOOTBALL_SQUAD_KEYWORDS:
-                if fk in modality_segment:
-                    sport = "Futebol"
-                    squad_label = modality_segment
-                    break
-
-    return {
-        "event_type": "match",
-        "team_a": team_a,
-        "team_b": team_b,
-        "benfica_home": benfica_home,
-        "opponent": opponent,
-        "sport": sport,
-        "squad_label": squad_label,
-        "broadcast": broadcast_info,
-    }
+        elif _FOOTBALL_SQUAD_RE.search(modality_segment):
+            sport = "Futebol"
+            squad_label = modality_segment
+
+    return SummaryInfo(
+        event_type="match",
+        team_a=team_a,
+        team_b=team_b,
+        benfica_home=benfica_home,
+        opponent=opponent,
+        sport=sport,
+        squad_label=squad_label,
+        broadcast=broadcast_info,
+    )
 
 
 # -------------------------------------------------------------------
@@ -259,12 +359,14 @@ def parse_summary(summary: str) -> Dict[str, Any]:
 
 
 def parse_event(component, source_name: str) -> Event:
-    dtstart = component.get("dtstart").dt
-    dtend = component.get("dtend").dt if component.get("dtend") else None
-    uid = str(component.get("uid"))
-    summary = str(component.get("summary") or "")
-    description = str(component.get("description") or "")
-    location = str(component.get("location") or "")
+    get = component.get
+    dtstart = get("dtstart").dt
+    dtend_prop = get("dtend")
+    dtend = dtend_prop.dt if dtend_prop is not None else None
+    uid = str(get("uid"))
+    summary = _text(get("summary"))
+    description = _text(get("description"))
+    location = _text(get("location"))
 
     # Normalise dates to Lisbon time
     if isinstance(dtstart, datetime) and dtstart.tzinfo:
@@ -272,8 +374,8 @@ def parse_event(component, source_name: str) -> Event:
     if isinstance(dtend, datetime) and dtend.tzinfo:
         dtend = dtend.astimezone(TZ)
 
-    lines = description.splitlines()
-    first_line = lines[0].strip() if lines else ""
+    # only the first line is needed, so don't split the whole description
+    first_line = description.partition("\n")[0].strip()
     competition, season, matchday = (
         parse_competition_line(first_line) if first_line else (None, None, None)
     )
@@ -302,63 +404,25 @@ def parse_event(component, source_name: str) -> Event:
         )
 
     # 2) Normal summary parsing (matches / other events)
-    summary_info = parse_summary(summary)
-
-    event_type = summary_info["event_type"]
-    benfica_home = summary_info["benfica_home"]
-    opponent = summary_info["opponent"]
-    sport = summary_info["sport"]
-    squad_label = summary_info["squad_label"]
-    broadcast = summary_info["broadcast"]
+    (
+        event_type,
+        _team_a,
+        _team_b,
+        benfica_home,
+        opponent,
+        sport,
+        squad_label,
+        broadcast,
+    ) = parse_summary(summary)
 
     # 3) Ticket URL extraction (for matches & other events)
     ticket_url = None
-    if "bilhete" in description.lower():
+    if _RE_BILHETE.search(description):
         ticket_url = extract_ticket_url(description)
 
     # 4) Football fallback heuristic
     if event_type == "match" and sport is None:
-        summary_lower = summary.lower()
-        comp_lower = (competition or "").lower()
-
-        looks_like_football = False
-
-        # football emoji in summary
-        if "⚽" in summary or "⚽️" in summary:
-            looks_like_football = True
-
-        # or competition name hints it's football
-        if any(key in comp_lower for key in FOOTBALL_COMP_KEYWORDS):
-            looks_like_football = True
-
-        if looks_like_football:
-            sport = "Futebol"
-
-            # if we still don't know the squad/gender, try to guess
-            if squad_label is None:
-                if (
-                    "feminina" in comp_lower
-                    or "feminino" in comp_lower
-                    or "feminina" in summary_lower
-                    or "feminino" in summary_lower
-                ):
-                    squad_label = "Feminino"
-                elif any(
-                    k in summary
-                    for k in [
-                        "Sub-23",
-                        "Sub 23",
-                        "Sub-19",
-                        "Sub 19",
-                        "Juniores",
-                        "Equipa B",
-                    ]
-                ):
-                    # leave as-is; parse_summary usually sets it anyway
-                    pass
-                else:
-                    # default to senior men's team
-                    squad_label = "Masculino"
+        sport, squad_label = guess_football(summary, competition, squad_label)
 
     return Event(
         uid=uid,
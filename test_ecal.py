@@ -1,6 +1,7 @@
 from icalendar import Calendar
 from datetime import datetime
-import pytz
+
+from Parsing.config import TZ
 
 
 events = []
@@ -11,23 +12,22 @@ with open("SL_Benfica.ics", "rb") as f:
 print("Events found:\n")
 
 test = 0
-for component in cal.walk():
-    if component.name == "VEVENT":
-        start = component.get("dtstart").dt
-        if isinstance(start, datetime) and start.tzinfo:
-            start = start.astimezone(pytz.timezone("Europe/Lisbon"))
+for component in cal.walk("VEVENT"):
+    start = component.get("dtstart").dt
+    if isinstance(start, datetime) and start.tzinfo:
+        start = start.astimezone(TZ)
 
-        events.append({
-            "start": start,
-            "summary": component.get("summary"),
-            "location": component.get("location"),
-            "uid": component.get("uid"),
-        })
-        test = test + 1
+    events.append({
+        "start": start,
+        "summary": component.get("summary"),
+        "location": component.get("location"),
+        "uid": component.get("uid"),
+    })
+    test = test + 1
 
 
 # 🔥 Sort by date
-events = sorted(events, key=lambda e: e["start"])
+events.sort(key=lambda e: e["start"])
 
 # Print
 for e in events: